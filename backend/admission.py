@@ -0,0 +1,180 @@
+import os
+import math
+import time
+import asyncio
+from collections import OrderedDict, deque, defaultdict
+from contextlib import asynccontextmanager
+
+# Admission Control
+# -----------------
+# Bounds in-flight LLM work per clinic and overall, queues the rest fairly
+# (round-robin across clinics) and sheds anything beyond that with a fast 429.
+# Above DEGRADE_THRESHOLD the triage route skips the LLM and answers from the
+# deterministic rule engines only.
+
+MAX_IN_FLIGHT = int(os.getenv("ADMISSION_MAX_IN_FLIGHT", "16"))
+MAX_PER_CLINIC = int(os.getenv("ADMISSION_MAX_PER_CLINIC", "4"))
+MAX_QUEUE_PER_CLINIC = int(os.getenv("ADMISSION_MAX_QUEUE_PER_CLINIC", "8"))
+QUEUE_TIMEOUT_SECONDS = float(os.getenv("ADMISSION_QUEUE_TIMEOUT", "5"))
+DEGRADE_THRESHOLD = float(os.getenv("ADMISSION_DEGRADE_THRESHOLD", "0.8"))
+
+DEFAULT_CLINIC = "default"
+
+
+def clinic_key(x_clinic_id, request) -> str:
+    """
+    Fairness key for a request: the X-Clinic-Id header, else the client's IP.
+    The header is not authenticated, so a client rotating IDs can claim extra
+    per-clinic share; MAX_IN_FLIGHT still caps the total.
+    """
+    if x_clinic_id:
+        return f"clinic:{x_clinic_id}"
+    if request is not None and request.client is not None:
+        return f"ip:{request.client.host}"
+    return DEFAULT_CLINIC
+
+
+class Overloaded(Exception):
+    """
+    Raised when a request cannot be admitted. `retry_after` is in whole seconds.
+    """
+
+    def __init__(self, retry_after: int):
+        super().__init__(f"Server overloaded. Retry after {retry_after}s.")
+        self.retry_after = retry_after
+
+
+class AdmissionController:
+    """
+    Must be used from a single event loop (FastAPI's). No locking needed.
+    """
+
+    def __init__(self, max_in_flight=MAX_IN_FLIGHT, max_per_clinic=MAX_PER_CLINIC,
+                 max_queue_per_clinic=MAX_QUEUE_PER_CLINIC, queue_timeout=QUEUE_TIMEOUT_SECONDS,
+                 degrade_threshold=DEGRADE_THRESHOLD):
+        self.max_in_flight = max_in_flight
+        self.max_per_clinic = max_per_clinic
+        self.max_queue_per_clinic = max_queue_per_clinic
+        self.queue_timeout = queue_timeout
+        self.degrade_threshold = degrade_threshold
+
+        self.in_flight = 0
+        self.per_clinic = defaultdict(int)
+        self.waiting = OrderedDict()  # clinic -> deque of futures, in round-robin order
+        self.queued = 0
+        self.avg_service_seconds = 2.0  # EWMA of slot hold time, seeds Retry-After
+
+    @property
+    def load(self) -> float:
+        return (self.in_flight + self.queued) / self.max_in_flight
+
+    @property
+    def degraded(self) -> bool:
+        return self.load >= self.degrade_threshold
+
+    def retry_after(self) -> int:
+        backlog = (self.in_flight + self.queued) / self.max_in_flight
+        return max(1, math.ceil(backlog * self.avg_service_seconds))
+
+    def snapshot(self) -> dict:
+        return {
+            "mode": "degraded" if self.degraded else "normal",
+            "load": round(self.load, 2),
+            "in_flight": self.in_flight,
+            "queued": self.queued,
+        }
+
+    def _grant(self, clinic):
+        self.in_flight += 1
+        self.per_clinic[clinic] += 1
+
+    def _can_start(self, clinic):
+        return self.in_flight < self.max_in_flight and self.per_clinic.get(clinic, 0) < self.max_per_clinic
+
+    def _dispatch(self):
+        """
+        Hands free slots to waiting clinics in round-robin order.
+        """
+        progressed = True
+        while progressed and self.in_flight < self.max_in_flight:
+            progressed = False
+            for clinic, queue in self.waiting.items():
+                if not self._can_start(clinic):
+                    continue
+                self.queued -= 1
+                self._grant(clinic)
+                queue.popleft().set_result(True)
+                if queue:
+                    self.waiting.move_to_end(clinic)
+                else:
+                    del self.waiting[clinic]
+                progressed = True
+                break
+
+    def _abandon(self, clinic, future):
+        queue = self.waiting.get(clinic)
+        if queue and future in queue:
+            queue.remove(future)
+            self.queued -= 1
+            if not queue:
+                del self.waiting[clinic]
+
+    async def acquire(self, clinic: str, wait: bool = True):
+        # _dispatch runs on every release, so anyone still waiting is blocked by a limit;
+        # a clinic with no queue of its own can start without jumping ahead of them
+        queue = self.waiting.get(clinic)
+        if not queue and self._can_start(clinic):
+            self._grant(clinic)
+            return
+
+        if not wait or (queue and len(queue) >= self.max_queue_per_clinic):
+            raise Overloaded(self.retry_after())
+        if queue is None:
+            queue = self.waiting[clinic] = deque()
+
+        future = asyncio.get_running_loop().create_future()
+        queue.append(future)
+        self.queued += 1
+        self._dispatch()
+        try:
+            await asyncio.wait_for(asyncio.shield(future), self.queue_timeout)
+        except asyncio.TimeoutError:
+            if future.done():
+                return  # granted at the deadline
+            self._abandon(clinic, future)
+            raise Overloaded(self.retry_after())
+        except BaseException:
+            # Client went away: give back a slot we were granted, or drop out of the queue
+            if future.done():
+                self.release(clinic)
+            else:
+                self._abandon(clinic, future)
+            raise
+
+    def release(self, clinic: str, held_seconds: float = None):
+        self.in_flight -= 1
+        self.per_clinic[clinic] -= 1
+        if not self.per_clinic[clinic]:
+            del self.per_clinic[clinic]
+        if held_seconds is not None:
+            self.avg_service_seconds = 0.8 * self.avg_service_seconds + 0.2 * held_seconds
+        self._dispatch()
+
+    @asynccontextmanager
+    async def slot(self, clinic: str = None, wait: bool = True):
+        """
+        async with admission.slot(clinic_id): <LLM call>
+        Raises Overloaded if the clinic cannot be admitted in time
+        (immediately, when wait=False).
+        """
+        clinic = clinic or DEFAULT_CLINIC
+        await self.acquire(clinic, wait)
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self.release(clinic, time.monotonic() - start)
+
+
+# Process-wide controller shared by the routes
+admission = AdmissionController()
@@ -1,6 +1,7 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from backend.routes import ingest, triage
+from backend.routes import ingest, triage, assess, surveillance
+from backend.admission import admission
 
 app = FastAPI(title="RuralClinic AI")
 
@@ -16,7 +17,9 @@ app.add_middleware(
 # Include Routers
 app.include_router(ingest.router)
 app.include_router(triage.router)
+app.include_router(assess.router)
+app.include_router(surveillance.router)
 
 @app.get("/")
 def health_check():
-    return {"status": "active", "system": "RuralClinic AI"}
+    return {"status": "active", "system": "RuralClinic AI", "admission": admission.snapshot()}
@@ -0,0 +1,44 @@
+from fastapi import APIRouter, HTTPException, Header, Request
+from fastapi.concurrency import run_in_threadpool
+from pydantic import BaseModel
+from typing import Optional
+from tools.assessment_engine import run_assessment, build_assessment
+from tools.surveillance import aggregator
+from backend.admission import admission, clinic_key, Overloaded
+
+router = APIRouter()
+
+class AssessRequest(BaseModel):
+    text: str
+    region: Optional[str] = None  # Block / village code for surveillance dashboards
+    encounter_id: Optional[str] = None  # Counted once by surveillance, even if resubmitted
+
+@router.post("/assess")
+async def process_assess(request: AssessRequest, http_request: Request,
+                         x_clinic_id: Optional[str] = Header(None)):
+    """
+    Receives raw patient text -> ONE Groq call (extraction + differential) -> Applies Rules -> Returns Recommendation
+    Same response as /triage, plus the extracted symptom JSON under 'extraction'.
+    """
+    if not request.text:
+        raise HTTPException(status_code=400, detail="Input text is empty")
+
+    # Extraction has no deterministic fallback, so over capacity we shed with 429
+    try:
+        async with admission.slot(clinic_key(x_clinic_id, http_request)):
+            # Groq client is blocking; keep it off the event loop
+            result = await run_in_threadpool(run_assessment, request.text)
+    except Overloaded as e:
+        raise HTTPException(status_code=429, detail=str(e), headers={"Retry-After": str(e.retry_after)})
+
+    if "error" in result:
+         raise HTTPException(status_code=500, detail=result["error"])
+
+    # Rules run on the extraction even when the LLM differential was unusable
+    triage_result = build_assessment(result["extraction"], result["diagnosis"])
+
+    # Feed population-level aggregates (NGO / network dashboards)
+    aggregator.record(triage_result["extraction"], triage_result["priority"], request.region,
+                      encounter_id=request.encounter_id)
+
+    return triage_result
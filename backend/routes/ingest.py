@@ -1,6 +1,9 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Header, Request
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
+from typing import Optional
 from tools.groq_client import extract_symptoms
+from backend.admission import admission, clinic_key, Overloaded
 
 router = APIRouter()
 
@@ -8,14 +11,21 @@ class IngestRequest(BaseModel):
     text: str
 
 @router.post("/ingest")
-async def process_ingest(request: IngestRequest):
+async def process_ingest(request: IngestRequest, http_request: Request,
+                         x_clinic_id: Optional[str] = Header(None)):
     """
     Receives raw patient text -> Calls Groq -> Returns Symptom JSON
     """
     if not request.text:
         raise HTTPException(status_code=400, detail="Input text is empty")
     
-    result = extract_symptoms(request.text)
+    # Extraction has no deterministic fallback, so over capacity we shed with 429
+    try:
+        async with admission.slot(clinic_key(x_clinic_id, http_request)):
+            # Groq client is blocking; keep it off the event loop
+            result = await run_in_threadpool(extract_symptoms, request.text)
+    except Overloaded as e:
+        raise HTTPException(status_code=429, detail=str(e), headers={"Retry-After": str(e.retry_after)})
     
     if "error" in result:
          raise HTTPException(status_code=500, detail=result["error"])
@@ -0,0 +1,34 @@
+from fastapi import APIRouter, HTTPException
+from typing import Optional
+from tools.surveillance import aggregator, ALL_REGIONS, WINDOW_BUCKETS
+
+router = APIRouter(prefix="/surveillance")
+
+@router.get("/counts")
+async def get_counts(region: str = ALL_REGIONS, symptoms: Optional[str] = None,
+                     priority: Optional[str] = None, days: int = WINDOW_BUCKETS):
+    """
+    Rolling encounter count for one symptom, a comma-separated pair, or a priority.
+    e.g. /surveillance/counts?region=block_a&symptoms=fever,rash&days=7
+    """
+    names = [s for s in (symptoms or "").split(",") if s.strip()]
+    try:
+        count = aggregator.count(region, symptoms=names, priority=priority, days=days)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return {"region": region, "symptoms": names, "priority": priority, "days": days, "count": count}
+
+@router.get("/top")
+async def get_top(region: str = ALL_REGIONS, days: int = WINDOW_BUCKETS, limit: int = 10):
+    """
+    Most frequent symptoms / symptom pairs in the window.
+    """
+    return {"region": region, "days": days, "top": aggregator.top(region, days=days, limit=limit)}
+
+@router.get("/anomalies")
+async def get_anomalies(region: Optional[str] = None, limit: int = 50):
+    """
+    Recent counts that exceeded their baseline.
+    """
+    return {"anomalies": aggregator.recent_anomalies(region, limit=limit)}
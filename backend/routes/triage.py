@@ -1,9 +1,12 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Header, Request
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from tools.rule_engine import evaluate_triage
 
-from tools.diagnosis_engine import run_differential_diagnosis
+from tools.diagnosis_engine import run_differential_diagnosis, check_critical_rules, deferred_diagnosis
+from tools.surveillance import aggregator
+from backend.admission import admission, clinic_key, Overloaded
 
 router = APIRouter()
 
@@ -11,9 +14,12 @@ router = APIRouter()
 # For now, we accept loose Dict to pass through to the Rule Engine
 class TriageRequest(BaseModel):
     payload: Dict[str, Any]
+    region: Optional[str] = None  # Block / village code for surveillance dashboards
+    encounter_id: Optional[str] = None  # Counted once by surveillance, even if resubmitted
 
 @router.post("/triage")
-async def process_triage(request: TriageRequest):
+async def process_triage(request: TriageRequest, http_request: Request,
+                         x_clinic_id: Optional[str] = Header(None)):
     """
     Receives Structured Symptom JSON -> Applies Rules -> Returns Recommendation
     """
@@ -29,9 +35,26 @@ async def process_triage(request: TriageRequest):
         
     demographics = request.payload.get("patient_demographics", {})
     
-    diagnosis = run_differential_diagnosis(all_symptoms, demographics)
+    # Critical overrides and the rule-based priority never wait on the LLM tier.
+    # Under load we skip the LLM rather than queue or reject the request.
+    diagnosis = check_critical_rules(all_symptoms)
+    if diagnosis is None:
+        if admission.degraded:
+            diagnosis = deferred_diagnosis()
+        else:
+            try:
+                async with admission.slot(clinic_key(x_clinic_id, http_request), wait=False):
+                    # Groq client is blocking; keep it off the event loop
+                    diagnosis = await run_in_threadpool(run_differential_diagnosis, all_symptoms, demographics)
+            except Overloaded:
+                diagnosis = deferred_diagnosis()
     
     # Merge results
     triage_result["diagnosis"] = diagnosis
+    triage_result["degraded"] = diagnosis.get("is_deferred", False)
+    
+    # 3. Feed population-level aggregates (NGO / network dashboards)
+    aggregator.record(request.payload, triage_result["priority"], request.region,
+                      encounter_id=request.encounter_id)
     
     return triage_result
@@ -0,0 +1,84 @@
+import sys
+import os
+import asyncio
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from backend.admission import AdmissionController, Overloaded
+
+def report(label, ok):
+    print(f"{'✅' if ok else '❌'} {label}: {'PASS' if ok else 'FAIL'}")
+    return ok
+
+async def hold(controller, clinic, order, i, seconds=0.05, wait=True):
+    try:
+        async with controller.slot(clinic, wait):
+            order.append((clinic, i))
+            await asyncio.sleep(seconds)
+        return "ok"
+    except Overloaded:
+        return "429"
+
+async def test_round_robin():
+    print("\n--- Round-robin across clinics ---")
+    controller = AdmissionController(max_in_flight=1, max_per_clinic=1, max_queue_per_clinic=10, queue_timeout=5)
+    order = []
+    # A floods first; B and C arrive later but must be interleaved, not starved
+    tasks = [asyncio.create_task(hold(controller, "A", order, i)) for i in range(3)]
+    await asyncio.sleep(0)
+    tasks += [asyncio.create_task(hold(controller, c, order, i)) for c in ("B", "C") for i in range(2)]
+    await asyncio.gather(*tasks)
+
+    clinics = [c for c, _ in order]
+    print(f"Order: {clinics}")
+    return report("A, B, C interleaved", clinics == ["A", "A", "B", "C", "A", "B", "C"])
+
+async def test_full_queue():
+    print("\n--- 429 on full queue ---")
+    controller = AdmissionController(max_in_flight=2, max_per_clinic=1, max_queue_per_clinic=2, queue_timeout=5)
+    order = []
+    tasks = [asyncio.create_task(hold(controller, "A", order, i)) for i in range(4)]
+    results = await asyncio.gather(*tasks)
+    ok = report("1 running + 2 queued admitted, 4th rejected", results == ["ok", "ok", "ok", "429"])
+
+    # Another clinic is unaffected by A's full queue
+    order = []
+    tasks = [asyncio.create_task(hold(controller, "A", order, i, seconds=0.2)) for i in range(3)]
+    await asyncio.sleep(0)
+    other = await hold(controller, "B", order, 0, wait=False)
+    await asyncio.gather(*tasks)
+    return report("other clinic still admitted immediately", other == "ok") and ok
+
+async def test_timeout_and_cancel_cleanup():
+    print("\n--- Cleanup after queue timeout / client cancel ---")
+    controller = AdmissionController(max_in_flight=1, max_per_clinic=1, max_queue_per_clinic=5, queue_timeout=0.05)
+    order = []
+    running = asyncio.create_task(hold(controller, "A", order, 0, seconds=0.2))
+    await asyncio.sleep(0)
+    timed_out = await hold(controller, "A", order, 1)
+    ok = report("queued request times out with 429", timed_out == "429")
+
+    controller.queue_timeout = 5
+    queued = asyncio.create_task(hold(controller, "A", order, 2))
+    await asyncio.sleep(0.01)
+    queued.cancel()
+    await asyncio.gather(running, queued, return_exceptions=True)
+
+    clean = (controller.in_flight == 0 and controller.queued == 0
+             and not controller.waiting and not controller.per_clinic)
+    print(f"State: {controller.snapshot()}")
+    return report("no leaked slots or queue entries", clean) and ok
+
+async def main():
+    results = [
+        await test_round_robin(),
+        await test_full_queue(),
+        await test_timeout_and_cancel_cleanup(),
+    ]
+    return all(results)
+
+if __name__ == "__main__":
+    print("Testing Admission Control...")
+    if not asyncio.run(main()):
+        sys.exit(1)
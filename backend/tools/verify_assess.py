@@ -0,0 +1,104 @@
+import sys
+import os
+import json
+from types import SimpleNamespace
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from tools import assessment_engine
+from tools.assessment_engine import ASSESS_SYSTEM_PROMPT, run_assessment, build_assessment
+
+# Offline check of the fused /assess path: the Groq call is replaced by canned responses
+
+def report(label, ok):
+    print(f"{'✅' if ok else '❌'} {label}: {'PASS' if ok else 'FAIL'}")
+    return ok
+
+def respond_with(content):
+    """
+    Points the shared Groq client at a canned response instead of the network.
+    """
+    def create(**kwargs):
+        message = SimpleNamespace(content=content if isinstance(content, str) else json.dumps(content))
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+    assessment_engine.client.chat.completions.create = create
+
+def extraction(*names, severity=5):
+    return {
+        "patient_input_summary": "Synthetic patient",
+        "body_systems": {"general": [{"name": n, "severity_scale": severity} for n in names]},
+    }
+
+LLM_DIAGNOSIS = {
+    "primary_diagnosis": "Viral Fever",
+    "confidence_score": 70,
+    "differentials": [],
+    "reasoning_summary": "Fever with body ache.",
+    "recommended_action": "Paracetamol, fluids",
+}
+
+def test_prompt():
+    print("\n--- Fused prompt ---")
+    return report("no 'DO NOT diagnose' in the fused prompt", "DO NOT diagnose" not in ASSESS_SYSTEM_PROMPT)
+
+def test_combined_response():
+    print("\n--- Combined response parsing ---")
+    respond_with({"extraction": extraction("fever", "body_ache"), "diagnosis": LLM_DIAGNOSIS})
+    result = run_assessment("Bukhar aur badan dard")
+    ok = report("extraction and diagnosis parsed",
+                "error" not in result and result["diagnosis"]["primary_diagnosis"] == "Viral Fever")
+
+    triage = build_assessment(result["extraction"], result["diagnosis"])
+    ok = report("LLM differential kept when no critical rule fires",
+                triage["priority"] == "GREEN" and triage["diagnosis"]["primary_diagnosis"] == "Viral Fever") and ok
+
+    respond_with("not json")
+    return report("invalid JSON -> error", "error" in run_assessment("...")) and ok
+
+def test_critical_precedence():
+    print("\n--- Critical rules override the LLM differential ---")
+    respond_with({"extraction": extraction("chest_pain", "Shortness of Breath", severity=8),
+                  "diagnosis": dict(LLM_DIAGNOSIS, primary_diagnosis="Acidity")})
+    result = run_assessment("Seene mein dard, saans phool rahi hai")
+    triage = build_assessment(result["extraction"], result["diagnosis"])
+    print(f"[Result]: {triage['priority']} / {triage['diagnosis']['primary_diagnosis']}")
+    return report("RED + critical MI instead of 'Acidity'",
+                  triage["priority"] == "RED"
+                  and triage["diagnosis"]["primary_diagnosis"] == "Possible Myocardial Infarction")
+
+def test_missing_diagnosis():
+    print("\n--- Missing / malformed diagnosis ---")
+    results = []
+    for label, diagnosis in [("missing", None), ("null primary", {"primary_diagnosis": None}), ("string", "Viral Fever")]:
+        response = {"extraction": extraction("chest_pain", severity=9)}
+        if diagnosis is not None:
+            response["diagnosis"] = diagnosis
+        respond_with(response)
+        result = run_assessment("Chest pain")
+        if "error" in result:
+            results.append(report(f"{label} diagnosis keeps the extraction", False))
+            continue
+        triage = build_assessment(result["extraction"], result["diagnosis"])
+        results.append(report(f"{label} diagnosis -> fallback + rule priority",
+                              triage["priority"] == "RED"
+                              and triage["diagnosis"]["primary_diagnosis"] == "Unspecified Clinical Presentation"))
+
+    respond_with({"diagnosis": LLM_DIAGNOSIS})
+    results.append(report("missing extraction -> error", "error" in run_assessment("Chest pain")))
+    return all(results)
+
+if __name__ == "__main__":
+    print("Testing Fused Assessment (offline)...")
+    original = assessment_engine.client.chat.completions.create
+    try:
+        results = [
+            test_prompt(),
+            test_combined_response(),
+            test_critical_precedence(),
+            test_missing_diagnosis(),
+        ]
+    finally:
+        assessment_engine.client.chat.completions.create = original
+    if not all(results):
+        sys.exit(1)
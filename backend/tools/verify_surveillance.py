@@ -0,0 +1,130 @@
+import sys
+import os
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from tools.surveillance import SurveillanceAggregator, BUCKET_SECONDS, RING_SIZE, WINDOW_BUCKETS, MIN_BASELINE_BUCKETS
+
+DAY = BUCKET_SECONDS
+START = 1000 * DAY
+
+class FakeClock:
+    def __init__(self):
+        self.now = START + 12 * 3600
+
+    def __call__(self):
+        return self.now
+
+def report(label, ok):
+    print(f"{'✅' if ok else '❌'} {label}: {'PASS' if ok else 'FAIL'}")
+    return ok
+
+def payload(*names, negated=()):
+    symptoms = [{"name": n} for n in names] + [{"name": n, "negated": True} for n in negated]
+    return {"body_systems": {"general": symptoms}}
+
+def test_exact_counts():
+    print("\n--- Exact symptom / pair counts ---")
+    agg = SurveillanceAggregator(clock=FakeClock())
+    for _ in range(30):
+        agg.record(payload("fever", "Rash"), "GREEN", "Block_A")
+    for _ in range(10):
+        agg.record(payload("bukhar", "cough", negated=["rash"]), "AMBER", "block_a")
+
+    results = [
+        report("fever (incl. alias) = 40", agg.count("block_a", ["fever"]) == 40),
+        report("rash (negated ignored) = 30", agg.count("block_a", ["rash"]) == 30),
+        report("fever + rash pair = 30", agg.count("block_a", ["rash", "fever"]) == 30),
+        report("fever + cough pair = 10", agg.count("block_a", ["fever", "cough"]) == 10),
+        report("AMBER priority = 10", agg.count("block_a", priority="amber") == 10),
+        report("'*' scope = 40", agg.count("*", ["fever"]) == 40),
+    ]
+    try:
+        agg.count("block_a", ["fever", "bukhar"])
+        results.append(report("self-pair rejected", False))
+    except ValueError:
+        results.append(report("self-pair rejected", True))
+    return all(results)
+
+def test_region_isolation():
+    print("\n--- Per-region top() unaffected by other regions ---")
+    agg = SurveillanceAggregator(clock=FakeClock())
+    for _ in range(12):
+        agg.record(payload("fever", "rash"), "GREEN", "block_a")
+    for _ in range(5):
+        agg.record(payload("cough"), "GREEN", "block_a")
+
+    # Heavy, varied traffic everywhere else
+    names = ["headache", "vomiting", "diarrhea", "chest_pain", "dizziness", "nausea", "fatigue", "cough"]
+    for region in range(100):
+        for i in range(20):
+            agg.record(payload(names[i % len(names)], names[(i + region) % len(names)]), "GREEN", f"block_{region}")
+
+    top = {tuple(item["symptoms"]): item["count"] for item in agg.top("block_a", limit=10)}
+    expected = {("fever",): 12, ("rash",): 12, ("fever", "rash"): 12, ("cough",): 5}
+    matched = {k: top.get(k) for k in expected}
+    print(f"Top: {top}")
+    ok = report("block_a top has exact counts", matched == expected and len(top) == len(expected))
+    return report("block_a fever count unaffected", agg.count("block_a", ["fever"]) == 12) and ok
+
+def steady_baseline(agg, clock, days):
+    for _ in range(days):
+        for _ in range(2):
+            agg.record(payload("cough"), "GREEN", "block_w")
+        clock.now += DAY
+
+def spike(agg):
+    raised = []
+    for _ in range(30):
+        raised.extend(agg.record(payload("fever"), "GREEN", "block_w"))
+    return raised
+
+def test_anomalies():
+    print("\n--- Warm-up, then a flag on a spike ---")
+    # Days since start-up before the spike; flags need the baseline plus a full window
+    first_flag_offset = MIN_BASELINE_BUCKETS + WINDOW_BUCKETS - 1
+
+    clock = FakeClock()
+    agg = SurveillanceAggregator(clock=clock)
+    steady_baseline(agg, clock, first_flag_offset - 1)
+    ok = report(f"no flag on day {first_flag_offset} (warm-up)", spike(agg) == [] and not agg.recent_anomalies())
+
+    clock = FakeClock()
+    agg = SurveillanceAggregator(clock=clock)
+    steady_baseline(agg, clock, first_flag_offset)
+    raised = spike(agg)
+    print(f"Raised: {raised}")
+    ok = report(f"fever spike flagged once on day {first_flag_offset + 1}",
+                len(raised) == 1 and raised[0]["symptoms"] == ["fever"]) and ok
+    ok = report("steady cough never flagged", all(a["symptoms"] != ["cough"] for a in agg.recent_anomalies())) and ok
+    return report("limit=0 still returns at most one flag", len(agg.recent_anomalies(limit=0)) == 1) and ok
+
+def test_out_of_ring_and_duplicates():
+    print("\n--- Out-of-ring timestamps and duplicate encounters ---")
+    clock = FakeClock()
+    agg = SurveillanceAggregator(clock=clock)
+    agg.record(payload("fever"), "GREEN", "block_a")
+
+    # Same ring slot as today, RING_SIZE days ago: must not reset today's bucket
+    old = agg.record(payload("fever"), "GREEN", "block_a", timestamp=clock.now - RING_SIZE * DAY)
+    future = agg.record(payload("fever"), "GREEN", "block_a", timestamp=clock.now + DAY)
+    ok = report("old / future timestamps ignored",
+                old == [] and future == [] and agg.count("block_a", ["fever"], days=RING_SIZE) == 1)
+
+    for _ in range(3):
+        agg.record(payload("rash"), "GREEN", "block_a", encounter_id="consult-1")
+    agg.record(payload("rash"), "GREEN", "block_b", encounter_id="consult-1")
+    ok = report("resubmitted encounter counted once", agg.count("block_a", ["rash"]) == 1) and ok
+    return report("same id in another region counted", agg.count("*", ["rash"]) == 2) and ok
+
+if __name__ == "__main__":
+    print("Testing Surveillance Aggregates...")
+    results = [
+        test_exact_counts(),
+        test_region_isolation(),
+        test_anomalies(),
+        test_out_of_ring_and_duplicates(),
+    ]
+    if not all(results):
+        sys.exit(1)
@@ -23,6 +23,7 @@ import { Alert } from "@/components/ui/Alert";
 import { Checkbox } from "@/components/ui/Checkbox";
 import { SymptomListSkeleton } from "@/components/ui/Skeleton";
 import { cn } from "@/lib/utils";
+import { apiHeaders, CLINIC_REGION } from "@/lib/api";
 import DashboardLayout from "@/components/layout/DashboardLayout";
 
 interface Symptom {
@@ -192,13 +193,15 @@ export default function SymptomReviewPage() {
           patient_input_summary: data?.rawText || "",
           patient_demographics: { age: "Unknown", sex: "Unknown" }, // TODO: Pass real demographics
           body_systems: bodySystemsMap
-        }
+        },
+        region: CLINIC_REGION,
+        encounter_id: data?.consultId // resubmitting the same consult is counted once
       };
 
       // Real Backend Call
       const response = await fetch("http://127.0.0.1:8000/triage", {
         method: "POST",
-        headers: { "Content-Type": "application/json" },
+        headers: apiHeaders(),
         body: JSON.stringify(payload),
       });
 
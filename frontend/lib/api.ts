@@ -13,6 +13,20 @@ export interface TriageResponse {
 
 const API_Base = "http://localhost:8000";
 
+// Identifies this clinic to the backend's admission control (fair share of AI capacity).
+// Unset -> no header, and the backend falls back to the client's IP address.
+const CLINIC_ID = process.env.NEXT_PUBLIC_CLINIC_ID;
+
+// Block / village code this clinic reports under in the surveillance dashboards.
+// Unset -> encounters are counted under "unknown".
+export const CLINIC_REGION = process.env.NEXT_PUBLIC_CLINIC_REGION;
+
+export function apiHeaders(): Record<string, string> {
+    const headers: Record<string, string> = { "Content-Type": "application/json" };
+    if (CLINIC_ID) headers["X-Clinic-Id"] = CLINIC_ID;
+    return headers;
+}
+
 export async function ingestPatientData(text: string): Promise<IngestResponse> {
     // Simulate API call delay for demo purposes if backend isn't running
     // return new Promise(resolve => setTimeout(() => resolve({
@@ -24,7 +38,7 @@ export async function ingestPatientData(text: string): Promise<IngestResponse> {
 
     const res = await fetch(`${API_Base}/ingest`, {
         method: "POST",
-        headers: { "Content-Type": "application/json" },
+        headers: apiHeaders(),
         body: JSON.stringify({ text }),
     });
     if (!res.ok) throw new Error("Failed to ingest data");
@@ -34,7 +48,7 @@ export async function ingestPatientData(text: string): Promise<IngestResponse> {
 export async function getTriage(patientId: string): Promise<TriageResponse> {
     const res = await fetch(`${API_Base}/triage`, {
         method: "POST",
-        headers: { "Content-Type": "application/json" },
+        headers: apiHeaders(),
         body: JSON.stringify({ patient_id: patientId }),
     });
     if (!res.ok) throw new Error("Failed to get triage");
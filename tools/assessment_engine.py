@@ -0,0 +1,87 @@
+import json
+from tools.rule_engine import evaluate_triage
+from tools.groq_client import client, EXTRACTION_RULES, GROQ_TIMEOUT_SECONDS
+from tools.diagnosis_engine import (DIAGNOSIS_SYSTEM_PROMPT, apply_sufficiency_threshold,
+                                     check_critical_rules, unavailable_diagnosis)
+
+# Fused Assessment (Single LLM Call)
+# ----------------------------------
+# One Groq round trip that returns both the extraction schema and the differential,
+# instead of extract_symptoms -> client -> run_differential_diagnosis.
+# The rule engines still run on the extracted symptoms in the route.
+# Only the extraction is required: a missing differential falls back like the two-call path.
+
+ASSESS_SYSTEM_PROMPT = """
+You are a clinical assessment engine. You perform TWO tasks on the patient's text and
+return BOTH in a single JSON object. Both "extraction" and "diagnosis" are REQUIRED.
+
+## TASK 1: SYMPTOM EXTRACTION
+Extract the patient's symptoms into the "extraction" object. Keep it a pure extraction
+(no diagnosis inside it).
+""" + EXTRACTION_RULES + """
+
+## TASK 2: DIFFERENTIAL DIAGNOSIS
+Base this ONLY on the symptoms, severities and demographics you extracted in Task 1.
+""" + DIAGNOSIS_SYSTEM_PROMPT + """
+
+## FINAL OUTPUT (STRICT JSON, NO MARKDOWN):
+{
+  "extraction": { ...Task 1 JSON SCHEMA... },
+  "diagnosis": { ...Task 2 OUTPUT JSON FORMAT... }
+}
+"""
+
+def run_assessment(text: str) -> dict:
+    """
+    Sends raw text to Groq Llama 3.3 once.
+    Returns {"extraction": <symptom JSON>, "diagnosis": <differential JSON>} or {"error": ...}.
+    Only an unusable extraction is an error; a missing or malformed diagnosis is replaced
+    by the same fallback run_differential_diagnosis uses.
+    """
+    try:
+        completion = client.chat.completions.create(
+            model="llama-3.3-70b-versatile",
+            messages=[
+                {"role": "system", "content": ASSESS_SYSTEM_PROMPT},
+                {"role": "user", "content": text}
+            ],
+            temperature=0.0,
+            response_format={"type": "json_object"},
+            timeout=GROQ_TIMEOUT_SECONDS
+        )
+
+        result = json.loads(completion.choices[0].message.content)
+        extraction = result.get("extraction")
+        if not isinstance(extraction, dict) or not isinstance(extraction.get("body_systems", {}), dict):
+            raise ValueError("Response missing a valid 'extraction'")
+
+        diagnosis = result.get("diagnosis")
+        if isinstance(diagnosis, dict) and isinstance(diagnosis.get("primary_diagnosis"), str):
+            diagnosis = apply_sufficiency_threshold(diagnosis)
+        else:
+            print("Groq Assessment Warning: response missing a valid 'diagnosis'")
+            diagnosis = unavailable_diagnosis()
+
+        return {"extraction": extraction, "diagnosis": diagnosis}
+
+    except Exception as e:
+        print(f"Groq Assessment Error: {e}")
+        return {"error": str(e)}
+
+def build_assessment(extraction: dict, llm_diagnosis: dict) -> dict:
+    """
+    Applies the deterministic rules to the extracted symptoms, exactly like /triage.
+    Critical rule matches override the LLM differential.
+    """
+    # 1. Standard Rule-Based Triage (Priority Level)
+    triage_result = evaluate_triage(extraction)
+
+    # 2. Critical rules override the LLM differential
+    all_symptoms = []
+    for symptoms in extraction.get("body_systems", {}).values():
+        all_symptoms.extend(symptoms)
+
+    triage_result["diagnosis"] = check_critical_rules(all_symptoms) or llm_diagnosis
+    triage_result["degraded"] = False
+    triage_result["extraction"] = extraction
+    return triage_result
@@ -0,0 +1,163 @@
+import os
+import sys
+import json
+import time
+import glob
+
+# Ensure we can import from project root
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+from tools import groq_client, diagnosis_engine
+from tools.groq_client import extract_symptoms
+from tools.diagnosis_engine import run_differential_diagnosis, check_critical_rules
+from tools.assessment_engine import run_assessment
+from tools.rule_engine import evaluate_triage
+from tools.symptom_vocab import symptom_id, raw_symptom_name
+from tools.payload_generator import flatten_symptoms
+
+# Fused vs Two-Call Assessment Benchmark
+# --------------------------------------
+# Runs every fixture text through both paths against the live Groq API and compares
+# end-to-end latency, tokens and agreement (priority, primary diagnosis, symptoms).
+# In-process timing omits the extra client hop of the two-call path.
+# Needs GROQ_API_KEY; record the summary in the README before quoting a speed-up.
+#
+#   python tools/bench_assess.py
+
+# Texts from tools/test_logic.py and the Hindi example in SYSTEM_PROMPT
+EXTRA_TEXTS = [
+    "I've had crushing chest pain for about 30 minutes. It hurts a lot.",
+    "I have a mild runny nose and cough since yesterday.",
+    "Mera haath toot gaya",
+]
+
+
+class UsageRecorder:
+    """
+    Wraps a Groq client's create() to count calls and tokens.
+    """
+
+    def __init__(self):
+        self.calls = 0
+        self.tokens = 0
+
+    def wrap(self, client):
+        create = client.chat.completions.create
+
+        def recorded(*args, **kwargs):
+            completion = create(*args, **kwargs)
+            self.calls += 1
+            usage = getattr(completion, "usage", None)
+            if usage is not None:
+                self.tokens += usage.total_tokens
+            return completion
+
+        client.chat.completions.create = recorded
+
+    def take(self):
+        calls, tokens = self.calls, self.tokens
+        self.calls = self.tokens = 0
+        return calls, tokens
+
+
+def fixture_texts():
+    """
+    Patient summaries from the ingest fixtures in the repo root.
+    """
+    texts = []
+    for path in sorted(glob.glob(os.path.join(project_root, "*.json"))):
+        try:
+            with open(path, "r", encoding="utf-8-sig") as f:
+                data = json.load(f)
+        except (ValueError, OSError):
+            continue
+        summary = data.get("patient_input_summary") if isinstance(data, dict) else None
+        if summary:
+            texts.append(summary)
+    return texts + EXTRA_TEXTS
+
+
+def symptom_ids(payload):
+    ids = set()
+    for s in flatten_symptoms(payload):
+        sid = symptom_id(raw_symptom_name(s))
+        # 0 is a valid ID (chest_pain); only unknown names fall back to the raw string
+        ids.add(sid if sid is not None else raw_symptom_name(s))
+    return ids
+
+
+def two_call(text):
+    payload = extract_symptoms(text)
+    if "error" in payload:
+        raise RuntimeError(payload["error"])
+    triage = evaluate_triage(payload)
+    diagnosis = run_differential_diagnosis(flatten_symptoms(payload), payload.get("patient_demographics", {}))
+    return payload, triage["priority"], diagnosis
+
+
+def fused(text):
+    result = run_assessment(text)
+    if "error" in result:
+        raise RuntimeError(result["error"])
+    payload = result["extraction"]
+    triage = evaluate_triage(payload)
+    diagnosis = check_critical_rules(flatten_symptoms(payload)) or result["diagnosis"]
+    return payload, triage["priority"], diagnosis
+
+
+def main():
+    recorder = UsageRecorder()
+    recorder.wrap(groq_client.client)
+    if diagnosis_engine.client is not groq_client.client:
+        recorder.wrap(diagnosis_engine.client)
+
+    print("--- ⏱️ Fused /assess vs /ingest + /triage ---")
+    totals = {"two_call": [0.0, 0, 0], "fused": [0.0, 0, 0]}
+    agree_priority = agree_diagnosis = 0
+    jaccard_total = 0.0
+    texts = fixture_texts()
+
+    for text in texts:
+        start = time.perf_counter()
+        payload_a, priority_a, diagnosis_a = two_call(text)
+        elapsed_a = time.perf_counter() - start
+        calls_a, tokens_a = recorder.take()
+
+        start = time.perf_counter()
+        payload_b, priority_b, diagnosis_b = fused(text)
+        elapsed_b = time.perf_counter() - start
+        calls_b, tokens_b = recorder.take()
+
+        for key, elapsed, calls, tokens in (("two_call", elapsed_a, calls_a, tokens_a),
+                                            ("fused", elapsed_b, calls_b, tokens_b)):
+            totals[key][0] += elapsed
+            totals[key][1] += calls
+            totals[key][2] += tokens
+
+        ids_a, ids_b = symptom_ids(payload_a), symptom_ids(payload_b)
+        jaccard = len(ids_a & ids_b) / len(ids_a | ids_b) if ids_a | ids_b else 1.0
+        same_dx = (diagnosis_a.get("primary_diagnosis") or "").lower() == (diagnosis_b.get("primary_diagnosis") or "").lower()
+        agree_priority += priority_a == priority_b
+        agree_diagnosis += same_dx
+        jaccard_total += jaccard
+
+        print(f"\n[Input]: \"{text[:70]}\"")
+        print(f"  two-call: {elapsed_a:5.2f}s {tokens_a:>5} tok | {priority_a:<5} | {diagnosis_a.get('primary_diagnosis')}")
+        print(f"  fused:    {elapsed_b:5.2f}s {tokens_b:>5} tok | {priority_b:<5} | {diagnosis_b.get('primary_diagnosis')}")
+        print(f"  symptom overlap: {jaccard:.2f} | {'✅' if priority_a == priority_b else '❌'} priority | "
+              f"{'✅' if same_dx else '⚠️'} diagnosis")
+
+    n = len(texts)
+    print("\n--- Summary ---")
+    for key, (elapsed, calls, tokens) in totals.items():
+        print(f"  {key:<8} | avg latency: {elapsed / n:5.2f}s | LLM calls: {calls / n:.1f} | avg tokens: {tokens / n:,.0f}")
+    print(f"  speed-up: {totals['two_call'][0] / totals['fused'][0]:.2f}x")
+    print(f"  agreement: priority {agree_priority}/{n} | primary diagnosis {agree_diagnosis}/{n} | "
+          f"mean symptom overlap {jaccard_total / n:.2f}")
+
+    return 0 if agree_priority == n else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
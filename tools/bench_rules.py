@@ -0,0 +1,253 @@
+import os
+import sys
+import json
+import time
+import hashlib
+import argparse
+import tracemalloc
+from collections import Counter
+
+# Ensure we can import from project root
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+from tools.rule_engine import evaluate_triage
+from tools import diagnosis_engine
+from tools.diagnosis_engine import check_critical_rules
+from tools.payload_generator import iter_corpus, flatten_symptoms
+from tools.symptom_vocab import SYMPTOM_NAMES, symptom_id
+
+# Rule Engine Micro-Benchmark
+# ---------------------------
+# Measures evaluations/sec and memory per call for evaluate_triage and
+# check_critical_rules over seeded synthetic corpora, and cross-checks that the
+# priority outcomes match the recorded baseline so speed-ups can be validated.
+#
+#   python tools/bench_rules.py                      # bench + check baseline
+#   python tools/bench_rules.py --sizes 1000000      # large corpus
+#   python tools/bench_rules.py --record             # update baseline after an intended logic change
+
+BASELINE_PATH = os.path.join(project_root, "tools", "bench_baseline.json")
+CHUNK_SIZE = 10000
+ALLOC_SAMPLE = 1000
+
+
+def chunks(size, seed, **kwargs):
+    """
+    Materializes the corpus in fixed-size chunks so generation stays out of the timed region
+    and memory stays flat for corpora of millions.
+    """
+    chunk = []
+    for payload in iter_corpus(size, seed, **kwargs):
+        chunk.append(payload)
+        if len(chunk) == CHUNK_SIZE:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def outcome_digest(size, seed):
+    """
+    Hashes (triage priority, critical condition) for every payload in the corpus.
+    Any change to rule outcomes changes the digest.
+    """
+    digest = hashlib.sha256()
+    counts = Counter()
+    for chunk in chunks(size, seed):
+        for payload in chunk:
+            priority = evaluate_triage(payload)["priority"]
+            critical = check_critical_rules(flatten_symptoms(payload))
+            condition = critical["primary_diagnosis"] if critical else "-"
+            digest.update(f"{priority}|{condition}\n".encode())
+            counts[priority] += 1
+            if critical:
+                counts["CRITICAL"] += 1
+    return {"digest": digest.hexdigest(), "counts": dict(sorted(counts.items()))}
+
+
+def bench_throughput(size, seed, **kwargs):
+    """
+    Returns evaluations/sec for each engine over a corpus of `size` payloads.
+    """
+    triage_time = 0.0
+    critical_time = 0.0
+    for chunk in chunks(size, seed, **kwargs):
+        symptom_lists = [flatten_symptoms(p) for p in chunk]
+
+        start = time.perf_counter()
+        for payload in chunk:
+            evaluate_triage(payload)
+        triage_time += time.perf_counter() - start
+
+        start = time.perf_counter()
+        for symptoms in symptom_lists:
+            check_critical_rules(symptoms)
+        critical_time += time.perf_counter() - start
+
+    return {
+        "evaluate_triage": size / triage_time if triage_time else 0.0,
+        "check_critical_rules": size / critical_time if critical_time else 0.0,
+    }
+
+
+def bench_allocations(seed, sample=ALLOC_SAMPLE):
+    """
+    Returns average peak bytes and retained blocks per call, measured with tracemalloc
+    on a small sample (tracing is too slow for full corpora).
+    """
+    payloads = list(iter_corpus(sample, seed))
+    symptom_lists = [flatten_symptoms(p) for p in payloads]
+    results = {}
+
+    for label, fn, args in [
+        ("evaluate_triage", evaluate_triage, payloads),
+        ("check_critical_rules", check_critical_rules, symptom_lists),
+    ]:
+        kept = []
+        peak_total = 0
+        tracemalloc.start()
+        before = tracemalloc.take_snapshot()
+        for arg in args:
+            tracemalloc.reset_peak()
+            base, _ = tracemalloc.get_traced_memory()
+            kept.append(fn(arg))
+            _, peak = tracemalloc.get_traced_memory()
+            peak_total += peak - base
+        after = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+
+        blocks = sum(stat.count_diff for stat in after.compare_to(before, "filename")
+                     if stat.traceback[0].filename.startswith(os.path.join(project_root, "tools")))
+        results[label] = {
+            "peak_bytes_per_call": peak_total / len(args),
+            "retained_blocks_per_call": blocks / len(args),
+        }
+    return results
+
+
+def bench_lookups(seed, size=ALLOC_SAMPLE):
+    """
+    Microseconds per symptom_id() call on the distinct names of a corpus, with the
+    lru_cache cleared (cold: alias + fuzzy path) and then warm.
+    """
+    names = sorted({raw_name for p in iter_corpus(size, seed) for s in flatten_symptoms(p)
+                    for raw_name in [s.get("name") or s.get("symptom") or ""]})
+    results = {"names": len(names)}
+    symptom_id.cache_clear()
+    for label in ("cold", "warm"):
+        start = time.perf_counter()
+        for name in names:
+            symptom_id(name)
+        results[label] = (time.perf_counter() - start) / len(names) * 1e6
+    results["unresolved"] = sum(symptom_id(name) is None for name in names)
+    return results
+
+
+def pad_critical_rules(extra):
+    """
+    Appends `extra` never-matching compiled rules to measure scaling with rule-set size.
+    Their bits sit above the vocabulary, so the symptom vocabulary itself is untouched.
+    Returns the original rule count.
+    """
+    original = len(diagnosis_engine.COMPILED_CRITICAL_RULES)
+    first_bit = len(SYMPTOM_NAMES)
+    padded = list(diagnosis_engine.COMPILED_CRITICAL_RULES)
+    for i in range(extra):
+        required = (1 << (first_bit + 2 * i)) | (1 << (first_bit + 2 * i + 1))
+        padded.append((required, {"symptoms": [], "condition": f"Synthetic Condition {i}", "severity": 1}))
+    diagnosis_engine.COMPILED_CRITICAL_RULES = padded
+    return original
+
+
+def restore_critical_rules(original):
+    del diagnosis_engine.COMPILED_CRITICAL_RULES[original:]
+
+
+def load_baseline():
+    if not os.path.exists(BASELINE_PATH):
+        return {}
+    with open(BASELINE_PATH, "r") as f:
+        return json.load(f)
+
+
+def save_baseline(baseline):
+    with open(BASELINE_PATH, "w") as f:
+        json.dump(baseline, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rule engine micro-benchmark")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--symptoms", type=int, nargs="+", default=[2, 8, 32],
+                        help="Symptoms-per-patient sweep (fixed count per payload)")
+    parser.add_argument("--rules", type=int, nargs="+", default=[0, 16, 64],
+                        help="Extra synthetic critical rules sweep")
+    parser.add_argument("--check-size", type=int, default=10000,
+                        help="Corpus size used for the outcome cross-check")
+    parser.add_argument("--record", action="store_true",
+                        help="Record the outcome digest as the new baseline")
+    args = parser.parse_args()
+
+    print("--- ⏱️ Rule Engine Benchmark ---")
+
+    print("\n[Throughput vs corpus size] (evals/sec)")
+    for size in args.sizes:
+        rates = bench_throughput(size, args.seed)
+        print(f"  n={size:>9,} | evaluate_triage: {rates['evaluate_triage']:>12,.0f} | "
+              f"check_critical_rules: {rates['check_critical_rules']:>12,.0f}")
+
+    sweep_size = min(args.sizes)
+    print(f"\n[Throughput vs symptoms per patient] (n={sweep_size:,})")
+    for count in args.symptoms:
+        rates = bench_throughput(sweep_size, args.seed, min_symptoms=count, max_symptoms=count)
+        print(f"  symptoms={count:>3} | evaluate_triage: {rates['evaluate_triage']:>12,.0f} | "
+              f"check_critical_rules: {rates['check_critical_rules']:>12,.0f}")
+
+    print(f"\n[Throughput vs critical rule-set size] (n={sweep_size:,})")
+    for extra in args.rules:
+        original = pad_critical_rules(extra)
+        try:
+            rates = bench_throughput(sweep_size, args.seed)
+        finally:
+            restore_critical_rules(original)
+        print(f"  rules={original + extra:>4} | check_critical_rules: {rates['check_critical_rules']:>12,.0f}")
+
+    lookups = bench_lookups(args.seed)
+    print(f"\n[Vocabulary lookup] ({lookups['names']} distinct names, {lookups['unresolved']} unresolved)")
+    print(f"  cold (cache miss): {lookups['cold']:>8.2f} µs/name | warm: {lookups['warm']:>6.2f} µs/name")
+
+    print(f"\n[Memory per call] (sample={ALLOC_SAMPLE})")
+    for label, stats in bench_allocations(args.seed).items():
+        print(f"  {label:<21} | peak: {stats['peak_bytes_per_call']:>8,.0f} B | "
+              f"retained blocks: {stats['retained_blocks_per_call']:.2f}")
+
+    print(f"\n[Outcome cross-check] (seed={args.seed}, n={args.check_size:,})")
+    key = f"{args.seed}:{args.check_size}"
+    current = outcome_digest(args.check_size, args.seed)
+    print(f"  counts: {current['counts']}")
+
+    baseline = load_baseline()
+    if args.record:
+        baseline[key] = current
+        save_baseline(baseline)
+        print(f"  📝 Baseline recorded for {key}")
+        return 0
+
+    expected = baseline.get(key)
+    if expected is None:
+        print(f"  ⚠️ No baseline for {key}. Run with --record to create one.")
+        return 0
+    if expected["digest"] == current["digest"]:
+        print("  ✅ Outcomes match baseline")
+        return 0
+
+    print("  ❌ Outcomes differ from baseline")
+    print(f"     expected counts: {expected['counts']}")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,12 +2,14 @@ import os
 import json
 from groq import Groq
 from dotenv import load_dotenv
+from tools.symptom_vocab import mask_of, symptom_mask
+from tools.groq_client import GROQ_TIMEOUT_SECONDS, GROQ_MAX_RETRIES
 
 # Load env from project root
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 load_dotenv(os.path.join(project_root, '.env'))
 
-client = Groq(api_key=os.getenv("GROQ_API_KEY"))
+client = Groq(api_key=os.getenv("GROQ_API_KEY"), max_retries=GROQ_MAX_RETRIES)
 
 DIAGNOSIS_SYSTEM_PROMPT = """
 You are an expert Chief Medical Officer (Internal Medicine). 
@@ -55,15 +57,24 @@ CRITICAL_RULES = [
     {"symptoms": ["active_bleeding", "dizziness"], "condition": "Hemorrhagic Shock", "severity": 10}
 ]
 
+def compile_rules(rules):
+    """
+    Pre-computes the symptom bitset for each rule so matching is a single AND per rule.
+    Raises ValueError if a rule names a symptom missing from CANONICAL_SYMPTOMS.
+    """
+    return [(mask_of(rule["symptoms"]), rule) for rule in rules]
+
+COMPILED_CRITICAL_RULES = compile_rules(CRITICAL_RULES)
+
 def check_critical_rules(symptoms_list):
     """
     Deterministic Red Flag Check
     """
-    normalized_symptoms = [s.get('name', '').lower() for s in symptoms_list]
+    present = symptom_mask(symptoms_list)
     
-    for rule in CRITICAL_RULES:
+    for required, rule in COMPILED_CRITICAL_RULES:
         # Check if ALL symptoms in the rule are present
-        if all(req in normalized_symptoms for req in rule["symptoms"]):
+        if present & required == required:
             return {
                 "primary_diagnosis": rule["condition"],
                 "confidence_score": 100,
@@ -74,6 +85,24 @@ def check_critical_rules(symptoms_list):
             }
     return None
 
+def apply_sufficiency_threshold(result):
+    """
+    Enforce Sufficiency Threshold (Safety Layer)
+    If AI is less than 25% confident, we suppress the diagnosis
+    """
+    if result.get("confidence_score", 0) < 25 and not result.get("primary_diagnosis", "").startswith("CRITICAL"):
+         result["primary_diagnosis"] = "Insufficient Clinical Data"
+         result["reasoning_summary"] = "The reported symptoms are too vague to form a reliable differential diagnosis. Please gather more history (duration, severity, location)."
+         result["recommended_action"] = "Conduct detailed patient interview."
+         result["differentials"] = []
+         # Fallback Dietary Advice (User Request: Show "Not enough data" message)
+         result["dietary_advice"] = {
+             "recommended_foods": [],
+             "foods_to_avoid": [],
+             "daily_habit": "We do not have enough symptoms to provide specific dietary advice."
+         }
+    return result
+
 def run_differential_diagnosis(symptoms_list, demographics=None):
     """
     Hybrid Diagnosis: Rules -> LLM
@@ -103,35 +132,41 @@ def run_differential_diagnosis(symptoms_list, demographics=None):
                 {"role": "user", "content": user_prompt}
             ],
             temperature=0.0,
-            response_format={"type": "json_object"}
+            response_format={"type": "json_object"},
+            timeout=GROQ_TIMEOUT_SECONDS
         )
         
         response_content = completion.choices[0].message.content
         result = json.loads(response_content)
         
-        # Enforce Sufficiency Threshold (Safety Layer)
-        # If AI is less than 25% confident, we suppress the diagnosis
-        if result.get("confidence_score", 0) < 25 and not result.get("primary_diagnosis", "").startswith("CRITICAL"):
-             result["primary_diagnosis"] = "Insufficient Clinical Data"
-             result["reasoning_summary"] = "The reported symptoms are too vague to form a reliable differential diagnosis. Please gather more history (duration, severity, location)."
-             result["recommended_action"] = "Conduct detailed patient interview."
-             result["differentials"] = []
-             # Fallback Dietary Advice (User Request: Show "Not enough data" message)
-             result["dietary_advice"] = {
-                 "recommended_foods": [],
-                 "foods_to_avoid": [],
-                 "daily_habit": "We do not have enough symptoms to provide specific dietary advice."
-             }
-             
-        return result
+        return apply_sufficiency_threshold(result)
         
     except Exception as e:
         print(f"Diagnosis LLM Error: {e}")
-        # Fallback
-        return {
-            "primary_diagnosis": "Unspecified Clinical Presentation",
-            "confidence_score": 0,
-            "differentials": [],
-            "reasoning_summary": "AI Service Unavailable. Clinical judgment required.",
-            "recommended_action": "Manual Triage Required"
-        }
+        return unavailable_diagnosis()
+
+def unavailable_diagnosis():
+    """
+    Fallback when the LLM call fails or returns no usable differential.
+    """
+    return {
+        "primary_diagnosis": "Unspecified Clinical Presentation",
+        "confidence_score": 0,
+        "differentials": [],
+        "reasoning_summary": "AI Service Unavailable. Clinical judgment required.",
+        "recommended_action": "Manual Triage Required"
+    }
+
+def deferred_diagnosis():
+    """
+    Placeholder used when the server skips the LLM under load.
+    The deterministic triage priority is still valid.
+    """
+    return {
+        "primary_diagnosis": "Diagnosis Deferred",
+        "confidence_score": 0,
+        "differentials": [],
+        "reasoning_summary": "Server under heavy load. Triage priority comes from deterministic rules; AI differential was skipped.",
+        "recommended_action": "Follow the triage action. Request the diagnosis again later.",
+        "is_deferred": True
+    }
@@ -7,7 +7,12 @@ from dotenv import load_dotenv
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 load_dotenv(os.path.join(project_root, '.env'))
 
-client = Groq(api_key=os.getenv("GROQ_API_KEY"))
+# Per-call deadline for Groq requests. Admission slots are held for the whole call and
+# threadpool calls cannot be cancelled, so a slow upstream must fail fast.
+GROQ_TIMEOUT_SECONDS = float(os.getenv("GROQ_TIMEOUT", "15"))
+GROQ_MAX_RETRIES = int(os.getenv("GROQ_MAX_RETRIES", "1"))
+
+client = Groq(api_key=os.getenv("GROQ_API_KEY"), max_retries=GROQ_MAX_RETRIES)
 
 # Load the Prompt from SOP
 sop_path = os.path.join(project_root, 'architecture', 'normalization_sop.md')
@@ -22,10 +27,14 @@ try:
 except Exception:
     pass
 
-SYSTEM_PROMPT = """
+# Role line kept apart from the rules so the fused /assess prompt can reuse the rules
+# without inheriting "You DO NOT diagnose" (see assessment_engine.py)
+EXTRACTION_ROLE = """
 You are a clinical data extraction engine. You DO NOT diagnose. You DO NOT provide medical advice.
 Your ONLY job is to extract symptoms from the patient's text and map them to the following JSON structure.
+"""
 
+EXTRACTION_RULES = """
 ### TRANSLATION RULE (CRITICAL):
 1. The input may be in **Hindi, Hinglish, or other regional languages**.
 2. **ALWAYS translate** the input to standard English internally BEFORE extracting symptoms.
@@ -87,6 +96,8 @@ Your ONLY job is to extract symptoms from the patient's text and map them to the
 }
 """
 
+SYSTEM_PROMPT = EXTRACTION_ROLE + EXTRACTION_RULES
+
 def extract_symptoms(text: str) -> dict:
     """
     Sends raw text to Groq Llama 3.3 and returns structured JSON.
@@ -99,7 +110,8 @@ def extract_symptoms(text: str) -> dict:
                 {"role": "user", "content": text}
             ],
             temperature=0.0,
-            response_format={"type": "json_object"}
+            response_format={"type": "json_object"},
+            timeout=GROQ_TIMEOUT_SECONDS
         )
         
         response_content = completion.choices[0].message.content
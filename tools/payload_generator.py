@@ -0,0 +1,201 @@
+import os
+import sys
+import random
+from datetime import datetime, timedelta, timezone
+
+# Ensure we can import from project root
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+from tools.symptom_vocab import CANONICAL_SYMPTOMS
+
+# Synthetic Symptom Payload Generator
+# -----------------------------------
+# Produces seeded, reproducible payloads shaped like the SYSTEM_PROMPT schema in
+# groq_client.py, including the messiness we see from the LLM in practice:
+# name variants (case, aliases, typos), the 'symptom' key fallback, missing fields
+# and symptoms spread across several body systems. Used by bench_rules.py.
+
+BODY_SYSTEMS = [
+    "general", "respiratory", "cardiovascular",
+    "gastrointestinal", "neurological",
+    "genitourinary", "musculoskeletal", "mental_health"
+]
+
+# Canonical snake_case names per body system.
+# Includes every symptom referenced by rule_engine.py and CRITICAL_RULES.
+SYMPTOM_POOL = {
+    "general": ["fever", "fatigue", "weakness", "sweating", "dizziness", "pain", "rash", "chills"],
+    "respiratory": ["cough", "shortness_of_breath", "sore_throat", "runny_nose", "wheezing"],
+    "cardiovascular": ["chest_pain", "palpitations", "swelling_legs"],
+    "gastrointestinal": ["abdominal_pain", "acidity", "vomiting", "diarrhea", "nausea"],
+    "neurological": ["headache", "facial_droop", "arm_weakness", "numbness", "confusion"],
+    "genitourinary": ["burning_urination", "frequent_urination"],
+    "musculoskeletal": ["fracture", "bone_trauma", "deformity", "limb_pain", "active_bleeding", "laceration"],
+    "mental_health": ["anxiety", "low_mood", "insomnia", "suicidal_ideation"],
+}
+
+# Pairs that trigger CRITICAL_RULES in diagnosis_engine.py
+CRITICAL_PAIRS = [
+    ("cardiovascular", "chest_pain", "respiratory", "shortness_of_breath"),
+    ("cardiovascular", "chest_pain", "general", "sweating"),
+    ("neurological", "facial_droop", "neurological", "arm_weakness"),
+    ("musculoskeletal", "active_bleeding", "general", "dizziness"),
+]
+
+FEVER_VALUES = ["99F", "101 degrees", "102F", "103.5F", "104F", "104.5 F", "105F", "40C", None]
+ONSETS = ["sudden", "gradual", "unknown"]
+QUALITIES = ["sharp", "dull", "crushing", "burning", "throbbing", "mild"]
+LOCATIONS = ["Head", "Chest", "Abdomen", "Leg", "Arm", "Back", "Throat"]
+CERTAINTIES = ["certain", "probable", "possible"]
+
+# Optional keys that may be dropped to simulate incomplete LLM output
+OPTIONAL_FIELDS = [
+    "value", "location", "severity_scale", "duration_value", "duration_unit",
+    "onset", "quality", "certainty", "negated", "notes"
+]
+
+
+def misspell(name: str, rng: random.Random, swap: bool = True) -> str:
+    """
+    Typo in the last word: adjacent swap (resolved by the fuzzy lookup) or a
+    doubled letter (left unresolved). The first letter is never touched.
+    """
+    words = name.split("_")
+    word = words[-1]
+    if len(word) < 4:
+        return name
+    i = rng.randint(1, len(word) - 2)
+    if swap:
+        word = word[:i] + word[i + 1] + word[i] + word[i + 2:]
+    else:
+        word = word[:i] + word[i] + word[i:]
+    return "_".join(words[:-1] + [word])
+
+
+def name_variant(name: str, rng: random.Random) -> str:
+    """
+    Renders a canonical name the way the LLM might spell it.
+    """
+    words = name.split("_")
+    roll = rng.random()
+    if roll < 0.45:
+        return name                               # chest_pain
+    if roll < 0.62:
+        return " ".join(w.capitalize() for w in words)  # Chest Pain
+    if roll < 0.72:
+        return " ".join(words)                    # chest pain
+    if roll < 0.78:
+        return "_".join(w.capitalize() for w in words)  # Chest_Pain
+    if roll < 0.81:
+        return name.upper()                       # CHEST_PAIN
+    if roll < 0.93:
+        aliases = CANONICAL_SYMPTOMS.get(name)    # seene mein dard
+        return rng.choice(aliases) if aliases else name
+    if roll < 0.98:
+        return misspell(name, rng)                # chest_pian
+    return misspell(name, rng, swap=False)        # chest_paain
+
+
+def make_symptom(name: str, system: str, rng: random.Random,
+                 missing_rate: float = 0.15, symptom_key_rate: float = 0.05) -> dict:
+    """
+    Builds a single symptom object. Some optional fields are dropped and a few
+    objects use the 'symptom' key instead of 'name'.
+    """
+    value = None
+    if name == "fever":
+        value = rng.choice(FEVER_VALUES)
+
+    symptom = {
+        "value": value,
+        "location": rng.choice(LOCATIONS) if rng.random() < 0.4 else None,
+        "severity_scale": rng.randint(0, 10),
+        "duration_value": rng.randint(1, 14) if rng.random() < 0.6 else None,
+        "duration_unit": rng.choice(["minutes", "hours", "days"]),
+        "body_system": system,
+        "onset": rng.choice(ONSETS),
+        "quality": rng.choice(QUALITIES),
+        "certainty": rng.choice(CERTAINTIES),
+        "negated": False,
+        "onset_timestamp": None,
+        "resolution_timestamp": None,
+        "notes": None,
+    }
+
+    for field in OPTIONAL_FIELDS:
+        if rng.random() < missing_rate:
+            del symptom[field]
+
+    key = "symptom" if rng.random() < symptom_key_rate else "name"
+    symptom[key] = name_variant(name, rng)
+    return symptom
+
+
+def make_payload(rng: random.Random, min_symptoms: int = 1, max_symptoms: int = 6,
+                 critical_rate: float = 0.1) -> dict:
+    """
+    Builds one full extraction payload matching the SYSTEM_PROMPT JSON schema.
+    """
+    body_systems = {system: [] for system in BODY_SYSTEMS}
+
+    picks = []
+    if rng.random() < critical_rate:
+        sys_a, name_a, sys_b, name_b = rng.choice(CRITICAL_PAIRS)
+        picks.extend([(sys_a, name_a), (sys_b, name_b)])
+
+    count = rng.randint(min_symptoms, max_symptoms)
+    while len(picks) < count:
+        system = rng.choice(BODY_SYSTEMS)
+        picks.append((system, rng.choice(SYMPTOM_POOL[system])))
+
+    for system, name in picks:
+        body_systems[system].append(make_symptom(name, system, rng))
+
+    timestamp = datetime(2024, 1, 1, tzinfo=timezone.utc) + timedelta(minutes=rng.randint(0, 525600))
+    payload = {
+        "patient_input_summary": "Synthetic patient with " + ", ".join(name for _, name in picks),
+        "extracted_timestamp": timestamp.isoformat(),
+        "patient_demographics": {
+            "age_value": rng.randint(1, 90) if rng.random() < 0.7 else None,
+            "age_unit": "years"
+        },
+        "body_systems": body_systems,
+        "flags": {"uncertainty_detected": rng.random() < 0.1, "missing_critical_info": []}
+    }
+
+    # LLM occasionally omits whole sections
+    if rng.random() < 0.05:
+        del payload["patient_demographics"]
+    if rng.random() < 0.05:
+        del payload["flags"]
+
+    return payload
+
+
+def iter_corpus(size: int, seed: int = 42, **kwargs):
+    """
+    Lazily yields `size` payloads. The same seed always yields the same corpus,
+    so corpora of millions never need to be held in memory.
+    """
+    rng = random.Random(seed)
+    for _ in range(size):
+        yield make_payload(rng, **kwargs)
+
+
+def flatten_symptoms(payload: dict) -> list:
+    """
+    Mirrors the flattening done in backend/routes/triage.py.
+    """
+    all_symptoms = []
+    for symptoms in payload.get("body_systems", {}).values():
+        all_symptoms.extend(symptoms)
+    return all_symptoms
+
+
+if __name__ == "__main__":
+    import json
+
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    for payload in iter_corpus(size):
+        print(json.dumps(payload))
@@ -1,3 +1,13 @@
+from tools.symptom_vocab import SYMPTOM_IDS, SYMPTOM_NAMES, symptom_id, normalize_key, raw_symptom_name
+
+# Interned IDs for the symptoms referenced by the rules below
+CHEST_PAIN = SYMPTOM_IDS["chest_pain"]
+SHORTNESS_OF_BREATH = SYMPTOM_IDS["shortness_of_breath"]
+FEVER = SYMPTOM_IDS["fever"]
+SUICIDAL_IDEATION = SYMPTOM_IDS["suicidal_ideation"]
+TRAUMA_IDS = frozenset(SYMPTOM_IDS[n] for n in ("fracture", "bone_trauma", "deformity"))
+TRAUMA_KEYWORDS = ("fracture", "bone", "deformity")
+
 def evaluate_triage(payload: dict) -> dict:
     """
     Applies deterministic IF/THEN rules to a structured symptom payload.
@@ -20,15 +30,17 @@ def evaluate_triage(payload: dict) -> dict:
         
     # --- RED FLAG RULES (IMMEDIATE) ---
     
+    # Each name is resolved to its canonical ID once (handles 'symptom' key fallback + aliases)
+    # and reused by the AMBER pass below
+    resolved = []
     for s in all_symptoms:
-        # Fallback if AI uses 'symptom' instead of 'name'
-        raw_name = s.get("name") or s.get("symptom") or ""
-        name = raw_name.lower().replace(" ", "_") # Force snake_case normalization
+        raw_name = raw_symptom_name(s)
+        sid = symptom_id(raw_name)
+        resolved.append((s, sid))
         severity = s.get("severity_scale", 0)
-        quality = s.get("quality", "").lower()
         
         # Rule 1: Chest Pain + High Severity
-        if name == "chest_pain" and severity >= 7:
+        if sid == CHEST_PAIN and severity >= 7:
             return {
                 "priority": "RED",
                 "action": "CRITICAL: Potential ACS. Dispatch Ambulance / ER Transfer.",
@@ -36,7 +48,7 @@ def evaluate_triage(payload: dict) -> dict:
             }
 
         # Rule 2: Shortness of Breath + Sudden
-        if name == "shortness_of_breath" and s.get("onset") == "sudden":
+        if sid == SHORTNESS_OF_BREATH and s.get("onset") == "sudden":
             return {
                 "priority": "RED",
                 "action": "CRITICAL: Respiratory Distress. Immediate Evaluation.",
@@ -44,7 +56,9 @@ def evaluate_triage(payload: dict) -> dict:
             }
 
         # Rule 3: Fracture / Major Trauma
-        if "fracture" in name or "bone" in name or "deformity" in name:
+        # Names outside the vocabulary (e.g. "compound_fracture") fall back to keyword matching
+        name = SYMPTOM_NAMES[sid] if sid is not None else normalize_key(raw_name)
+        if sid in TRAUMA_IDS or (sid is None and any(k in name for k in TRAUMA_KEYWORDS)):
             # We treat mentioned fractures as critical in rural settings due to lack of imaging
             return {
                 "priority": "RED",
@@ -54,14 +68,13 @@ def evaluate_triage(payload: dict) -> dict:
 
     # --- AMBER FLAG RULES (URGENT) ---
     
-    for s in all_symptoms:
-        name = s.get("name", "").lower()
+    for s, sid in resolved:
         val_str = str(s.get("value", "0"))
         
         # Rule 3: High Fever (>104F)
         # Simple extraction logic: check if '104' is in value string
         # In a real app, we'd have a helper to parse floats safely
-        if name == "fever" and ("104" in val_str or "105" in val_str):
+        if sid == FEVER and ("104" in val_str or "105" in val_str):
              result = { # Don't return yet, check for higher priority? (Red > Amber)
                 "priority": "AMBER",
                 "action": "URGENT: High Grade Fever. Evaluate within 1 hour.",
@@ -69,7 +82,7 @@ def evaluate_triage(payload: dict) -> dict:
             }
             
         # Rule 4: Suicidal Ideation
-        if name == "suicidal_ideation":
+        if sid == SUICIDAL_IDEATION:
              return { # Mental health safety is often immediate/high priority
                 "priority": "AMBER",
                 "action": "URGENT: Mental Health Crisis. Monitor Patient 1:1.",
@@ -0,0 +1,338 @@
+import math
+import time
+import threading
+from collections import deque, OrderedDict
+from itertools import combinations
+
+from tools.symptom_vocab import SYMPTOM_NAMES, symptom_id, raw_symptom_name
+
+# Outbreak & Surveillance Aggregates
+# ----------------------------------
+# Streaming, memory-bounded counts fed by every completed /triage.
+# Time is split into fixed buckets held in a ring; each bucket owns a count-min sketch
+# (approximate counts for any region/symptom/pair/priority key) and a Space-Saving
+# heavy-hitter table per region. Memory is fixed by the constants below, regardless of volume.
+#
+# State lives in this process only: it is lost on restart and split across uvicorn
+# workers (run the backend with a single worker for correct counts). Anomaly flags
+# need MIN_BASELINE_BUCKETS days of baseline before the current window, so the first
+# flag can fire on day MIN_BASELINE_BUCKETS + WINDOW_BUCKETS (21) after start-up.
+#
+# Encounters carrying an id are counted once, so a re-POST of /triage (e.g. after a
+# deferred diagnosis) does not inflate counts. Encounters without an id are counted every time.
+
+BUCKET_SECONDS = 24 * 3600   # 1 day per bucket
+WINDOW_BUCKETS = 7           # "this week"
+BASELINE_BUCKETS = 28        # history used as the expected level
+RING_SIZE = WINDOW_BUCKETS + BASELINE_BUCKETS
+
+SKETCH_WIDTH = 4096
+SKETCH_DEPTH = 4
+PAIR_HEAVY_HITTERS = 64      # tracked symptom pairs per region per bucket
+GLOBAL_PAIR_HEAVY_HITTERS = 128  # tracked symptom pairs for the "*" scope per bucket
+MAX_REGION_TABLES = 64       # regions with their own top-k tables per bucket
+
+ANOMALY_MIN_COUNT = 5        # ignore tiny counts
+MIN_BASELINE_BUCKETS = 14    # days of observed baseline (before the window) required to flag
+ANOMALY_Z = 3.0              # Poisson z-score above baseline that raises a flag
+MAX_ANOMALIES = 200          # most recent flags kept for the dashboards
+MAX_TRACKED_ENCOUNTERS = 20000  # encounter ids remembered for de-duplication
+
+ALL_REGIONS = "*"
+
+
+class CountMinSketch:
+    """
+    Fixed-size approximate counter. Never under-counts; over-counts by at most
+    ~e/width of the total with high probability.
+    """
+
+    def __init__(self, width=SKETCH_WIDTH, depth=SKETCH_DEPTH):
+        self.width = width
+        self.depth = depth
+        self.rows = [[0] * width for _ in range(depth)]
+
+    def indexes(self, key):
+        """
+        Column per row for `key`. Sketches of equal size share these, so callers
+        summing many buckets hash once.
+        """
+        return [hash((i, key)) % self.width for i in range(self.depth)]
+
+    def add(self, key, count=1, indexes=None):
+        # Conservative update: only raise counters that are at the current minimum,
+        # which keeps collision over-counts much lower than a plain increment
+        cells = list(zip(self.rows, indexes or self.indexes(key)))
+        target = min(row[j] for row, j in cells) + count
+        for row, j in cells:
+            if row[j] < target:
+                row[j] = target
+
+    def estimate(self, key, indexes=None):
+        return min(row[j] for row, j in zip(self.rows, indexes or self.indexes(key)))
+
+    def clear(self):
+        self.rows = [[0] * self.width for _ in range(self.depth)]
+
+
+class HeavyHitters:
+    """
+    Space-Saving top-k tracker. Keeps at most `capacity` keys; any key whose true
+    frequency exceeds total/capacity is guaranteed to be present.
+    """
+
+    def __init__(self, capacity=PAIR_HEAVY_HITTERS):
+        self.capacity = capacity
+        self.counts = {}
+
+    def add(self, key, count=1):
+        if key in self.counts or len(self.counts) < self.capacity:
+            self.counts[key] = self.counts.get(key, 0) + count
+            return
+        evicted = min(self.counts, key=self.counts.get)
+        self.counts[key] = self.counts.pop(evicted) + count
+
+    def bound(self, key):
+        """
+        Upper bound on the true count of `key`: its tracked count, or for an
+        untracked key the smallest tracked count (0 while the table is not full).
+        """
+        if key in self.counts:
+            return self.counts[key]
+        if len(self.counts) < self.capacity:
+            return 0
+        return min(self.counts.values())
+
+    def clear(self):
+        self.counts.clear()
+
+
+class _Bucket:
+    def __init__(self):
+        self.epoch = -1
+        self.sketch = CountMinSketch()
+        # region -> {"symptom": table, "pair": table}, at most MAX_REGION_TABLES + "*".
+        # The symptom table holds the whole vocabulary, so its counts are exact.
+        self.heavy = {}
+
+    def reset(self, epoch):
+        self.epoch = epoch
+        self.sketch.clear()
+        self.heavy = {}
+
+    def track(self, key):
+        """
+        Feeds a symptom / pair key into its region's top-k tables. Regions beyond
+        MAX_REGION_TABLES in a bucket are still counted by the sketch, just not ranked.
+        """
+        region = key[0]
+        tables = self.heavy.get(region)
+        if tables is None:
+            if region == ALL_REGIONS:
+                pairs = GLOBAL_PAIR_HEAVY_HITTERS
+            elif len(self.heavy) - (ALL_REGIONS in self.heavy) < MAX_REGION_TABLES:
+                pairs = PAIR_HEAVY_HITTERS
+            else:
+                return
+            tables = self.heavy[region] = {
+                "symptom": HeavyHitters(len(SYMPTOM_NAMES)),
+                "pair": HeavyHitters(pairs),
+            }
+        tables[key[1]].add(key)
+
+    def estimate(self, key, indexes):
+        """
+        Sketch estimate, tightened by the region's top-k table when it tracks this key type.
+        Both are upper bounds, so the smaller one is closer to the truth.
+        """
+        estimate = self.sketch.estimate(key, indexes)
+        tables = self.heavy.get(key[0]) if key[1] != "priority" else None
+        return min(estimate, tables[key[1]].bound(key)) if tables is not None else estimate
+
+
+def symptom_key(region, sid):
+    return (region, "symptom", sid)
+
+
+def pair_key(region, a, b):
+    return (region, "pair") + ((a, b) if a < b else (b, a))
+
+
+def priority_key(region, priority):
+    return (region, "priority", priority)
+
+
+def describe_key(key):
+    """
+    Turns an internal key tuple into a JSON-friendly dict for the dashboards.
+    """
+    region, kind = key[0], key[1]
+    if kind == "symptom":
+        return {"region": region, "type": kind, "symptoms": [SYMPTOM_NAMES[key[2]]]}
+    if kind == "pair":
+        return {"region": region, "type": kind, "symptoms": [SYMPTOM_NAMES[key[2]], SYMPTOM_NAMES[key[3]]]}
+    return {"region": region, "type": kind, "priority": key[2]}
+
+
+class SurveillanceAggregator:
+    """
+    Rolling per-region counts by canonical symptom, symptom pair and priority.
+    Updates and queries touch a fixed number of buckets, so both are constant time.
+    """
+
+    def __init__(self, clock=time.time):
+        self.clock = clock
+        self.buckets = [_Bucket() for _ in range(RING_SIZE)]
+        self.anomalies = deque(maxlen=MAX_ANOMALIES)
+        self.total = 0
+        self.first_epoch = None  # first day observed by this process
+        self.encounters = OrderedDict()  # recently recorded (region, encounter id), oldest first
+        self._lock = threading.Lock()
+
+    def _epoch(self, timestamp=None):
+        return int((self.clock() if timestamp is None else timestamp) // BUCKET_SECONDS)
+
+    def _bucket(self, epoch):
+        bucket = self.buckets[epoch % RING_SIZE]
+        if bucket.epoch != epoch:
+            bucket.reset(epoch)
+        return bucket
+
+    def _sum(self, key, first_epoch, last_epoch, indexes=None):
+        indexes = indexes or self.buckets[0].sketch.indexes(key)
+        total = 0
+        for epoch in range(first_epoch, last_epoch + 1):
+            bucket = self.buckets[epoch % RING_SIZE]
+            if bucket.epoch == epoch:
+                total += bucket.estimate(key, indexes)
+        return total
+
+    def record(self, payload: dict, priority: str, region: str = None, timestamp=None,
+               encounter_id: str = None):
+        """
+        Adds one completed encounter. Negated and unrecognized symptoms are ignored,
+        as are timestamps outside the ring (older than RING_SIZE days or in the future)
+        and encounter ids already recorded. Returns any anomalies raised by this encounter.
+        """
+        region = (region or "unknown").strip().lower()
+        if region == ALL_REGIONS:
+            region = "unknown"
+
+        sids = set()
+        for symptoms in payload.get("body_systems", {}).values():
+            for s in symptoms:
+                if s.get("negated"):
+                    continue
+                sid = symptom_id(raw_symptom_name(s))
+                if sid is not None:
+                    sids.add(sid)
+
+        keys = []
+        for scope in (region, ALL_REGIONS):
+            keys.append(priority_key(scope, priority))
+            keys.extend(symptom_key(scope, sid) for sid in sids)
+            keys.extend(pair_key(scope, a, b) for a, b in combinations(sids, 2))
+
+        with self._lock:
+            epoch = self._epoch(timestamp)
+            current = self._epoch()
+            if not current - RING_SIZE < epoch <= current:
+                return []
+            if encounter_id is not None:
+                # Scoped by region so ids from different clinics never collide
+                seen = (region, encounter_id)
+                if seen in self.encounters:
+                    return []
+                self.encounters[seen] = None
+                if len(self.encounters) > MAX_TRACKED_ENCOUNTERS:
+                    self.encounters.popitem(last=False)
+            if self.first_epoch is None or epoch < self.first_epoch:
+                self.first_epoch = epoch
+
+            bucket = self._bucket(epoch)
+            key_indexes = [bucket.sketch.indexes(key) for key in keys]
+            for key, indexes in zip(keys, key_indexes):
+                bucket.sketch.add(key, indexes=indexes)
+                if key[1] != "priority":
+                    bucket.track(key)
+            self.total += 1
+
+            raised = []
+            for key, indexes in zip(keys, key_indexes):
+                if key[0] == region and key[1] != "priority":
+                    anomaly = self._check_anomaly(key, epoch, indexes)
+                    if anomaly:
+                        raised.append(anomaly)
+                        self.anomalies.append(anomaly)
+            return raised
+
+    def _check_anomaly(self, key, epoch, indexes):
+        # Days of baseline actually observed; with too little history everything looks new
+        observed = min(BASELINE_BUCKETS, epoch - WINDOW_BUCKETS - self.first_epoch + 1)
+        if observed < MIN_BASELINE_BUCKETS:
+            return None
+
+        current = self._sum(key, epoch - WINDOW_BUCKETS + 1, epoch, indexes)
+        history = self._sum(key, epoch - RING_SIZE + 1, epoch - WINDOW_BUCKETS, indexes)
+        expected = history * WINDOW_BUCKETS / observed
+
+        # Flag only on the encounter that first crosses the threshold in this window
+        threshold = max(ANOMALY_MIN_COUNT, expected + ANOMALY_Z * math.sqrt(max(expected, 1.0)))
+        if current < threshold or current - 1 >= threshold:
+            return None
+        return dict(describe_key(key), count=current, baseline=round(expected, 2),
+                    detected_at=epoch * BUCKET_SECONDS)
+
+    def count(self, region=ALL_REGIONS, symptoms=None, priority=None, days=WINDOW_BUCKETS):
+        """
+        Approximate encounters in the last `days` for one symptom, a symptom pair, or a priority.
+        """
+        region = region.strip().lower()
+        if priority:
+            key = priority_key(region, priority.upper())
+        else:
+            sids = [symptom_id(name) for name in symptoms or []]
+            if not sids or len(sids) > 2 or None in sids:
+                raise ValueError("Provide one or two known symptoms, or a priority")
+            if len(sids) == 2 and sids[0] == sids[1]:
+                raise ValueError("A symptom pair needs two different symptoms")
+            key = symptom_key(region, sids[0]) if len(sids) == 1 else pair_key(region, *sids)
+
+        days = max(1, min(days, RING_SIZE))
+        with self._lock:
+            epoch = self._epoch()
+            return self._sum(key, epoch - days + 1, epoch)
+
+    def top(self, region=ALL_REGIONS, days=WINDOW_BUCKETS, limit=10):
+        """
+        Most frequent symptoms and pairs in the window, from the heavy-hitter tables.
+        """
+        region = region.strip().lower()
+        days = max(1, min(days, RING_SIZE))
+        limit = max(1, limit)
+        with self._lock:
+            epoch = self._epoch()
+            candidates = set()
+            for e in range(epoch - days + 1, epoch + 1):
+                bucket = self.buckets[e % RING_SIZE]
+                if bucket.epoch == e and region in bucket.heavy:
+                    for table in bucket.heavy[region].values():
+                        candidates.update(table.counts)
+            ranked = sorted(((self._sum(k, epoch - days + 1, epoch), k) for k in candidates),
+                            key=lambda item: item[0], reverse=True)
+        return [dict(describe_key(k), count=c) for c, k in ranked[:limit]]
+
+    def recent_anomalies(self, region=None, limit=50):
+        """
+        Most recent flags first, at least one and at most MAX_ANOMALIES.
+        """
+        limit = max(1, limit)
+        with self._lock:
+            flags = list(self.anomalies)
+        if region:
+            flags = [a for a in flags if a["region"] == region.strip().lower()]
+        return flags[-limit:][::-1]
+
+
+# Process-wide aggregator shared by the routes
+aggregator = SurveillanceAggregator()
@@ -0,0 +1,227 @@
+import re
+from functools import lru_cache
+
+# Canonical Symptom Vocabulary
+# ----------------------------
+# Single source of truth for symptom names shared by rule_engine.py and diagnosis_engine.py.
+# Every canonical name is interned to an integer ID once at import time. Raw LLM names
+# ("Chest Pain", "chest pain", "seene mein dard", "chest_pian") resolve to the same ID,
+# so downstream rules compare ints and bitsets instead of strings.
+
+# canonical_name -> aliases (synonyms, Hindi/Hinglish, common LLM spellings)
+CANONICAL_SYMPTOMS = {
+    # --- Cardiovascular ---
+    "chest_pain": ["chest ache", "chest discomfort", "chest tightness", "cardiac pain",
+                   "seene mein dard", "seene me dard", "chhati mein dard", "सीने में दर्द"],
+    "palpitations": ["heart racing", "racing heart", "fast heartbeat", "dhadkan tez", "दिल की धड़कन तेज"],
+    "swelling_legs": ["leg swelling", "pedal edema", "pair mein sujan", "pairon mein sujan"],
+
+    # --- Respiratory ---
+    "shortness_of_breath": ["breathlessness", "difficulty breathing", "breathing difficulty",
+                            "difficulty in breathing", "trouble breathing",
+                            "short of breath", "dyspnea", "dyspnoea", "sob",
+                            "saans phoolna", "saans lene mein taklif", "सांस फूलना"],
+    "cough": ["khansi", "khaansi", "खांसी"],
+    "sore_throat": ["throat pain", "gale mein dard", "gala kharab"],
+    "runny_nose": ["rhinorrhea", "nasal discharge", "naak behna"],
+    "wheezing": ["wheeze"],
+
+    # --- General ---
+    "fever": ["pyrexia", "high fever", "high temperature", "febrile", "bukhar", "bukhaar", "बुखार"],
+    "sweating": ["diaphoresis", "excessive sweating", "cold sweat", "paseena", "pasina", "पसीना"],
+    "dizziness": ["vertigo", "lightheadedness", "light headedness", "giddiness",
+                  "chakkar", "chakkar aana", "चक्कर"],
+    "fatigue": ["tiredness", "exhaustion", "thakan", "thakaan"],
+    "weakness": ["generalized weakness", "general weakness", "kamzori", "kamjori", "कमजोरी"],
+    "chills": ["rigors", "shivering", "kapkapi", "thand lagna"],
+    "rash": ["skin rash", "daane", "chakatte"],
+    "pain": ["dard", "दर्द"],
+    "body_ache": ["body pain", "bodyache", "badan dard"],
+    "swelling": ["severe swelling", "sujan", "soojan"],
+
+    # --- Gastrointestinal ---
+    "abdominal_pain": ["stomach ache", "stomach pain", "stomachache", "belly pain", "tummy ache",
+                       "pet dard", "pet mein dard", "पेट दर्द"],
+    "acidity": ["heartburn", "acid reflux", "gas", "seene mein jalan"],
+    "vomiting": ["emesis", "throwing up", "ulti", "उल्टी"],
+    "diarrhea": ["diarrhoea", "loose motions", "loose stools", "dast", "दस्त"],
+    "nausea": ["feeling sick", "ji machalna"],
+
+    # --- Neurological ---
+    "headache": ["head pain", "head ache", "sar dard", "sir dard", "सिर दर्द"],
+    "facial_droop": ["face drooping", "facial drooping", "face droop", "facial weakness", "mooh tedha"],
+    "arm_weakness": ["weak arm", "hemiparesis", "haath mein kamzori"],
+    "numbness": ["tingling", "sunn", "sunn hona"],
+    "confusion": ["disorientation", "altered mental status"],
+
+    # --- Genitourinary ---
+    "burning_urination": ["dysuria", "painful urination", "peshab mein jalan"],
+    "frequent_urination": ["polyuria", "baar baar peshab"],
+
+    # --- Musculoskeletal / Trauma ---
+    "fracture": ["broken bone", "bone fracture", "broken arm", "broken leg", "broken hand",
+                 "haddi tootna", "haddi toot gayi", "haath toot gaya"],
+    "bone_trauma": ["bone injury"],
+    "deformity": ["limb deformity"],
+    "limb_pain": ["leg pain", "arm pain", "haath pair dard"],
+    "active_bleeding": ["bleeding", "hemorrhage", "haemorrhage", "blood loss",
+                        "khoon behna", "khoon nikalna", "खून बहना"],
+    "laceration": ["cut", "wound", "ghav"],
+
+    # --- Mental Health ---
+    "suicidal_ideation": ["suicidal thoughts", "thoughts of suicide", "wants to die",
+                          "atmahatya ke vichar"],
+    "anxiety": ["ghabrahat", "panic"],
+    "low_mood": ["depression", "sadness", "udaasi"],
+    "insomnia": ["sleeplessness", "neend na aana"],
+}
+
+# Fuzzy fallback is only tried for keys at least this long
+FUZZY_MIN_LENGTH = 5
+
+_SEPARATORS = re.compile(r"[\s\-]+")
+
+SYMPTOM_IDS = {}    # canonical_name -> id
+SYMPTOM_NAMES = []  # id -> canonical_name
+_ALIAS_TABLE = {}   # normalized key -> id
+_SINGULAR_TABLE = {}  # singular key -> id ("chest_pains" and "palpitation" resolve here)
+_FUZZY_INDEX = {}   # (first token, token count) -> [normalized keys]
+
+
+def normalize_key(raw_name: str) -> str:
+    """
+    Lowercase + snake_case. The only string normalization applied to symptom names.
+    """
+    return _SEPARATORS.sub("_", raw_name.strip().lower()).strip("_")
+
+
+def _singular_token(token: str) -> str:
+    """
+    Crude English singular: "pains" -> "pain", "aches" -> "ache", "rashes" -> "rash".
+    Leaves "-ss", "-is", "-us" words alone ("weakness", "emesis").
+    """
+    if len(token) < 4 or token.endswith(("ss", "is", "us")):
+        return token
+    if token.endswith(("sses", "shes", "xes", "zes")):
+        return token[:-2]
+    if token.endswith("s"):
+        return token[:-1]
+    return token
+
+
+def _singular_key(key: str) -> str:
+    return "_".join(_singular_token(t) for t in key.split("_"))
+
+
+def _add_alias(key, sid):
+    _SINGULAR_TABLE.setdefault(_singular_key(key), sid)
+    if _ALIAS_TABLE.setdefault(key, sid) != sid:
+        return
+    tokens = key.split("_")
+    _FUZZY_INDEX.setdefault((tokens[0], len(tokens)), []).append(key)
+
+
+def _compile_vocabulary():
+    for canonical, aliases in CANONICAL_SYMPTOMS.items():
+        key = normalize_key(canonical)
+        sid = len(SYMPTOM_NAMES)
+        SYMPTOM_IDS[key] = sid
+        SYMPTOM_NAMES.append(key)
+        _add_alias(key, sid)
+        for alias in aliases:
+            _add_alias(normalize_key(alias), sid)
+
+
+def _is_typo(a: str, b: str, swap_only: bool = False) -> bool:
+    """
+    True if two equal-length tokens differ by one adjacent swap or, unless swap_only,
+    one substitution, never in the first letter. Insertions/deletions are rejected
+    ("plain" != "pain").
+    """
+    if len(a) != len(b) or a[0] != b[0]:
+        return False
+    diffs = [i for i in range(len(a)) if a[i] != b[i]]
+    if len(diffs) == 1:
+        return not swap_only
+    return (len(diffs) == 2 and diffs[1] == diffs[0] + 1
+            and a[diffs[0]] == b[diffs[1]] and a[diffs[1]] == b[diffs[0]])
+
+
+def _fuzzy_lookup(key: str):
+    """
+    Conservative misspelling match: same first token (so the body part never changes),
+    same token count, and exactly one token with a single typo.
+    Single words have no anchor token, and a one-letter substitution there is usually
+    another real word ("smelling" -> swelling), so they only accept an adjacent swap.
+    """
+    tokens = key.split("_")
+    single = len(tokens) == 1
+    if single:
+        # Single word: the typo rule itself keeps the first letter fixed
+        candidates = [k for (first, n), keys in _FUZZY_INDEX.items()
+                      if n == 1 and first[0] == key[0] for k in keys]
+    else:
+        candidates = _FUZZY_INDEX.get((tokens[0], len(tokens)), [])
+
+    match = None
+    for candidate in candidates:
+        pairs = [(t, c) for t, c in zip(tokens, candidate.split("_")) if t != c]
+        if len(pairs) == 1 and len(pairs[0][0]) >= 4 and _is_typo(*pairs[0], swap_only=single):
+            if match is not None and _ALIAS_TABLE[candidate] != _ALIAS_TABLE[match]:
+                return None  # ambiguous
+            match = candidate
+    return _ALIAS_TABLE[match] if match else None
+
+
+@lru_cache(maxsize=4096)
+def symptom_id(raw_name: str):
+    """
+    Maps a raw symptom name to its interned ID, or None if unknown.
+    Exact alias lookup first, then singular/plural ("headaches", "palpitation"),
+    then a conservative fuzzy match for LLM misspellings.
+    """
+    if not raw_name:
+        return None
+    key = normalize_key(raw_name)
+    sid = _ALIAS_TABLE.get(key)
+    if sid is None:
+        sid = _SINGULAR_TABLE.get(_singular_key(key))
+    if sid is not None or len(key) < FUZZY_MIN_LENGTH:
+        return sid
+    return _fuzzy_lookup(key)
+
+
+_compile_vocabulary()
+
+
+def raw_symptom_name(symptom: dict) -> str:
+    """
+    Reads the symptom name, falling back to the 'symptom' key the LLM sometimes uses.
+    """
+    return symptom.get("name") or symptom.get("symptom") or ""
+
+
+def symptom_mask(symptoms_list) -> int:
+    """
+    Encodes a flat symptom list as a bitset of interned IDs.
+    """
+    mask = 0
+    for s in symptoms_list:
+        sid = symptom_id(raw_symptom_name(s))
+        if sid is not None:
+            mask |= 1 << sid
+    return mask
+
+
+def mask_of(names) -> int:
+    """
+    Bitset for a list of canonical names. Raises ValueError for names not in
+    CANONICAL_SYMPTOMS, so a typo in a rule set fails loudly instead of never firing.
+    """
+    mask = 0
+    for name in names:
+        sid = SYMPTOM_IDS.get(normalize_key(name))
+        if sid is None:
+            raise ValueError(f"Unknown canonical symptom in rule: {name!r}")
+        mask |= 1 << sid
+    return mask
@@ -7,6 +7,8 @@ project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.append(project_root)
 
 from tools.rule_engine import evaluate_triage
+from tools.diagnosis_engine import check_critical_rules, compile_rules
+from tools.symptom_vocab import symptom_id, SYMPTOM_IDS
 
 def test_rule_engine_isolation():
     print("--- 🧪 Testing Rule Engine (Isolation) ---")
@@ -55,5 +57,59 @@ def test_rule_engine_isolation():
     else:
          print("❌ Rule Engine Logic: FAIL (Expected Green)")
 
+def report(label, ok):
+    print(f"{'✅' if ok else '❌'} {label}: {'PASS' if ok else 'FAIL'}")
+    return ok
+
+def test_name_normalization():
+    print("\n--- 🧪 Testing Symptom Name Normalization ---")
+    results = []
+
+    # Case / spacing variants must all hit the same rules
+    for name in ["Chest Pain", "chest pain", "chest_pain"]:
+        payload = {"body_systems": {"cardiovascular": [{"name": name, "severity_scale": 9}]}}
+        results.append(report(f"'{name}' -> RED", evaluate_triage(payload)["priority"] == "RED"))
+
+    # Second (AMBER) pass used to only lowercase
+    payload = {"body_systems": {"mental_health": [{"name": "Suicidal Ideation"}]}}
+    results.append(report("'Suicidal Ideation' -> AMBER", evaluate_triage(payload)["priority"] == "AMBER"))
+
+    # 'symptom' key fallback in the critical rules
+    symptoms = [{"symptom": "Chest Pain"}, {"symptom": "shortness of breath"}]
+    critical = check_critical_rules(symptoms)
+    results.append(report("'symptom' key -> critical MI",
+                          critical is not None and critical["primary_diagnosis"] == "Possible Myocardial Infarction"))
+
+    # Fuzzy match must only fix typos, never change the body part or meaning
+    results.append(report("'chest_pian' -> chest_pain", symptom_id("chest_pian") == SYMPTOM_IDS["chest_pain"]))
+    for name in ["hand pain", "hand ache", "chest plain"]:
+        results.append(report(f"'{name}' -> unknown", symptom_id(name) is None))
+
+    # Singular / plural spellings
+    for name, canonical in [("palpitation", "palpitations"), ("headaches", "headache"),
+                            ("chest pains", "chest_pain"), ("difficulty in breathing", "shortness_of_breath"),
+                            ("rashes", "rash")]:
+        results.append(report(f"'{name}' -> {canonical}", symptom_id(name) == SYMPTOM_IDS[canonical]))
+
+    # A one-letter change in a single word is usually another real word
+    for name in ["smelling", "spelling", "slivering"]:
+        results.append(report(f"'{name}' -> unknown", symptom_id(name) is None))
+    results.append(report("'shivreing' -> chills", symptom_id("shivreing") == SYMPTOM_IDS["chills"]))
+
+    # Bare 'trauma' is ambiguous (head / emotional); it must not escalate to fracture
+    payload = {"body_systems": {"general": [{"name": "trauma", "severity_scale": 5}]}}
+    results.append(report("'trauma' -> GREEN", evaluate_triage(payload)["priority"] == "GREEN"))
+
+    # A typo in a rule set must fail loudly
+    try:
+        compile_rules([{"symptoms": ["sweat", "chest_pain"], "condition": "Typo", "severity": 10}])
+        results.append(report("unknown rule symptom raises", False))
+    except ValueError:
+        results.append(report("unknown rule symptom raises", True))
+
+    return all(results)
+
 if __name__ == "__main__":
     test_rule_engine_isolation()
+    if not test_name_normalization():
+        sys.exit(1)